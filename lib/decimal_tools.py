@@ -1,25 +1,84 @@
 import random
 from decimal import Decimal
+from functools import lru_cache
 from typing import TypeAlias
 
 SupportsDecimal: TypeAlias = Decimal | str | float
 
+DEFAULT_DIGITS = 2
+
+# The bounds are checked by the callers, so randint() and its argument checks can be skipped.
+_randbelow = random._inst._randbelow  # type: ignore[attr-defined]
+
+
+def roll_decimal(minimum: Decimal | float,
+                 maximum: Decimal | float,
+                 digits: int = DEFAULT_DIGITS,
+                 ) -> Decimal:
+
+    assert digits >= 0
+
+    min_ = _scale(minimum, digits)
+    max_ = _scale(maximum, digits)
+    _ensure_valid_bounds(min_, max_)
+
+    return Decimal(min_ + _randbelow(max_ - min_ + 1)) / _get_comma_shift(digits)
+
+
+def roll_decimal_batch(minimum: Decimal | float,
+                       maximum: Decimal | float,
+                       count: int,
+                       digits: int = DEFAULT_DIGITS,
+                       ) -> list[Decimal]:
 
-def roll_decimal(minimum: Decimal, maximum: Decimal, digits: int = 2) -> Decimal:
     assert digits >= 0
+    assert count >= 0
+
+    min_ = _scale(minimum, digits)
+    max_ = _scale(maximum, digits)
+    _ensure_valid_bounds(min_, max_)
+    comma_shift = _get_comma_shift(digits)
+    width = max_ - min_ + 1
 
-    comma_shift: int = 10 ** digits
-    min_ = int(minimum * comma_shift)
-    max_ = int(maximum * comma_shift)
+    return [Decimal(min_ + _randbelow(width)) / comma_shift for _ in range(count)]
 
-    return Decimal(random.randint(min_, max_)) / comma_shift
+
+def _scale(value: Decimal | float, digits: int) -> int:
+    if isinstance(value, float):
+        return int(value * 10 ** digits)
+    return int(value.scaleb(digits))
+
+
+def _ensure_valid_bounds(minimum: int, maximum: int) -> None:
+    if minimum > maximum:
+        raise ValueError(f"Empty range for a roll: {minimum} > {maximum}.")
+
+
+@lru_cache(maxsize=16)
+def _get_comma_shift(digits: int) -> Decimal:
+    return Decimal(10 ** digits)
 
 
 class DecimalRange:
 
+    __slots__ = ("_lower",
+                 "_upper",
+                 "_comma_shift",
+                 "_scaled_lower",
+                 "_scaled_upper",
+                 "_width",
+                 "_constant",
+                 )
+
+    _scaled_lower: int
+    _scaled_upper: int
+    _width: int
+    _constant: Decimal | None
+
     def __init__(self, _lower: SupportsDecimal, _upper: SupportsDecimal):
         self._lower = Decimal(_lower)
         self._upper = Decimal(_upper)
+        self._comma_shift = _get_comma_shift(DEFAULT_DIGITS)
         self._adjust_order()
 
     @property
@@ -41,8 +100,28 @@ class DecimalRange:
         self._adjust_order()
 
     def get_random_value(self) -> Decimal:
-        return roll_decimal(self.lower, self.upper)
+        if self._constant is not None:
+            # Still drawn, so that seeded sequences stay the same as with a real roll.
+            _randbelow(1)
+            return self._constant
+        return Decimal(self._scaled_lower + _randbelow(self._width)) / self._comma_shift
+
+    def get_random_values(self, count: int) -> list[Decimal]:
+        if self._constant is not None:
+            for _ in range(count):
+                _randbelow(1)
+            return [self._constant] * count
+        lower, width = self._scaled_lower, self._width
+        return [Decimal(lower + _randbelow(width)) / self._comma_shift for _ in range(count)]
 
     def _adjust_order(self) -> None:
         if self._lower > self._upper:
             self._lower, self._upper = self._upper, self._lower
+
+        self._scaled_lower = int(self._lower.scaleb(DEFAULT_DIGITS))
+        self._scaled_upper = int(self._upper.scaleb(DEFAULT_DIGITS))
+        self._width = self._scaled_upper - self._scaled_lower + 1
+        if self._width == 1:
+            self._constant = Decimal(self._scaled_lower) / self._comma_shift
+        else:
+            self._constant = None
@@ -1,12 +1,5 @@
-import cProfile
+import os
 import pathlib
-import pstats
-
-import pygame as pg
-
-from src.adventure import MapLoader
-from src.game import Game
-from src.sprites import SpriteKeeper
 
 RESOURCE_DIR = pathlib.Path(__file__).parent / "res"
 SCREEN_SIZE = (720, 480)
@@ -15,6 +8,12 @@ MAP_DEF = RESOURCE_DIR / "room_1_def.lua"
 
 
 def main() -> None:
+    import pygame as pg
+
+    from src.adventure import MapLoader
+    from src.game import Game
+    from src.sprites import SpriteKeeper
+
     pg.init()
     map_loader = MapLoader(resource_dir=RESOURCE_DIR)
     sprite_keeper = SpriteKeeper(resource_dir=RESOURCE_DIR)
@@ -28,9 +27,16 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    with cProfile.Profile() as p:
+    # Profiling hooks into every call and skews frame times, so it is opt-in.
+    if os.environ.get("WIZ_PROFILE"):
+        import cProfile
+        import pstats
+
+        with cProfile.Profile() as p:
+            main()
+
+        info = pstats.Stats(p)
+        info.sort_stats(pstats.SortKey.TIME)
+        info.print_stats(30)
+    else:
         main()
-
-    info = pstats.Stats(p)
-    info.sort_stats(pstats.SortKey.TIME)
-    info.print_stats(30)
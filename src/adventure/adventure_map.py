@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    ClassVar,
     Iterable,
+    Iterator,
     MutableSequence,
     Self,
     SupportsIndex,
+    TypeAlias,
     TypeVar,
     overload,
 )
@@ -17,14 +20,28 @@ from pytmx import TiledElement, TiledMap
 # from sprites import SpriteKeeper
 from src.sprites import SpriteKeeper
 
-from .blueprint import AdventureMapTrigger
+from .blueprint import AdventureMapTrigger, Position
 from .character import Character
 from .character_loader import CharacterBuilder
-from .entity import Entity, MovingEntity
+from .entity import Entity
+
+# Zone lists shorter than this are scanned linearly, which is faster than a grid lookup.
+GRID_THRESHOLD = 32
+GRID_CELL_SIZE = 64
+
+# Indices of the zones in a grid cell and their rects, stored side by side.
+GridCell: TypeAlias = tuple[list[int], list[Rect]]
+
+_EMPTY_CELL: GridCell = ([], [])
 
 
 class Zone:
 
+    # Zones which can move are not put into the spatial grid and are always checked.
+    movable: ClassVar[bool] = False
+
+    __slots__ = ("_rect",)
+
     def __init__(self, rect: Rect) -> None:
         self._rect = rect
 
@@ -35,6 +52,8 @@ class Zone:
 
 class TriggerZone(Zone):
 
+    __slots__ = ("_trigger",)
+
     def __init__(self, rect: Rect, trigger: AdventureMapTrigger) -> None:
         super().__init__(rect)
         self._trigger = trigger
@@ -46,8 +65,13 @@ class TriggerZone(Zone):
 
 class CharacterTriggerZone(TriggerZone):
 
+    movable = True
+
+    __slots__ = ("_character",)
+
     def __init__(self, character: Character) -> None:
         assert character.trigger is not None
+        # The collision box is moved in place, so sharing it keeps the zone in sync.
         super().__init__(rect=character.entity.collision_box,
                          trigger=character.trigger)
         self._character = character
@@ -63,7 +87,10 @@ TZone = TypeVar("TZone", bound=Zone)
 class ZoneList(MutableSequence[TZone]):
 
     def __init__(self, zones: list[TZone] | None = None) -> None:
-        self._zones = zones if zones is not None else []
+        self._zones = list(zones) if zones is not None else []
+        self._rects = [zone.rect for zone in self._zones]
+        self._grid: dict[tuple[int, int], GridCell] | None = None
+        self._movable: list[int] = []
 
     @overload
     def __getitem__(self, i: SupportsIndex, /) -> TZone: ...
@@ -71,9 +98,9 @@ class ZoneList(MutableSequence[TZone]):
     def __getitem__(self, s: slice, /) -> Self: ...
 
     def __getitem__(self, it: SupportsIndex | slice, /) -> TZone | Self:
-        if isinstance(it, SupportsIndex):
-            return self._zones[it]
-        return type(self)(self._zones[it])
+        if type(it) is slice:
+            return type(self)(self._zones[it])
+        return self._zones[it]
 
     @overload
     def __setitem__(self, i: SupportsIndex, o: TZone, /) -> None: ...
@@ -81,34 +108,92 @@ class ZoneList(MutableSequence[TZone]):
     def __setitem__(self, s: slice, o: Iterable[TZone], /) -> None: ...
 
     def __setitem__(self, it: Any, o: Any, /) -> None:
+        if type(it) is slice:
+            o = list(o)
+            self._rects[it] = [zone.rect for zone in o]
+        else:
+            self._rects[it] = o.rect
         self._zones[it] = o
+        self._grid = None
 
     def __delitem__(self, i: SupportsIndex | slice, /) -> None:
         del (self._zones[i])
+        del (self._rects[i])
+        self._grid = None
 
     def __len__(self) -> int:
         return len(self._zones)
 
+    def extend(self, values: Iterable[TZone]) -> None:
+        if values is self:
+            values = list(values)
+        start = len(self._zones)
+        self._zones.extend(values)
+        self._rects.extend(zone.rect for zone in self._zones[start:])
+        self._grid = None
+
     def insert(self, index: int, value: TZone) -> None:
         self._zones.insert(index, value)
+        self._rects.insert(index, value.rect)
+        self._grid = None
 
     @property
     def rects(self) -> list[Rect]:
-        return [zone.rect for zone in self._zones]
+        return self._rects
 
     def collides(self, entity: Entity) -> bool:
-        if isinstance(entity, MovingEntity):
-            return entity.find_collision(self.rects) > -1
-        else:
-            return entity.rect.collidelist(self.rects) > -1
+        if len(self._zones) < GRID_THRESHOLD:
+            return entity.find_collision(self._rects) > -1
+
+        _, rects = self._get_candidates(entity.collision_box)
+        return entity.find_collision(rects) > -1
 
     def get_colliding_zones(self, entity: Entity) -> Self:
-        if isinstance(entity, MovingEntity):
-            collisions = entity.find_all_collisions(self.rects)
-        else:
-            collisions = entity.rect.collidelistall(self.rects)
+        if len(self._zones) < GRID_THRESHOLD:
+            collisions = entity.find_all_collisions(self._rects)
+            return type(self)([self._zones[i] for i in collisions])
 
-        return type(self)([self._zones[i] for i in collisions])
+        indices, rects = self._get_candidates(entity.collision_box)
+        collisions = entity.find_all_collisions(rects)
+        return type(self)([self._zones[indices[i]] for i in collisions])
+
+    def _build_grid(self) -> dict[tuple[int, int], GridCell]:
+        cells: dict[tuple[int, int], list[int]] = {}
+        self._movable = []
+
+        for index, zone in enumerate(self._zones):
+            if zone.movable:
+                self._movable.append(index)
+                continue
+
+            for cell in _get_cells(zone.rect):
+                cells.setdefault(cell, []).append(index)
+
+        grid = {cell: (indices, [self._rects[i] for i in indices])
+                for cell, indices in cells.items()}
+        self._grid = grid
+        return grid
+
+    def _get_candidates(self, rect: Rect) -> GridCell:
+        grid = self._grid if self._grid is not None else self._build_grid()
+        cells = list(_get_cells(rect))
+
+        if len(cells) == 1 and not self._movable:
+            return grid.get(cells[0], _EMPTY_CELL)
+
+        candidates = set(self._movable)
+        for cell in cells:
+            candidates.update(grid.get(cell, _EMPTY_CELL)[0])
+
+        # Preserve the order in which the zones are stored.
+        indices = sorted(candidates)
+        return indices, [self._rects[i] for i in indices]
+
+
+def _get_cells(rect: Rect) -> Iterator[tuple[int, int]]:
+    for x in range(rect.left // GRID_CELL_SIZE, (rect.right - 1) // GRID_CELL_SIZE + 1):
+        for y in range(rect.top // GRID_CELL_SIZE, (rect.bottom - 1) // GRID_CELL_SIZE + 1):
+            yield x, y
 
 
 class AdventureMap:
@@ -120,12 +205,16 @@ class AdventureMap:
 
     def __init__(self, tmx: TiledMap, sprite_keeper: SpriteKeeper) -> None:
         self._tmx = tmx
+        self._layers = {layer.name: layer for layer in tmx.layers}
+        self._layer_indices = {layer.name: i for i, layer in enumerate(tmx.layers)}
         self._characters: set[Character] = set()
+        self._characters_snapshot: tuple[Character, ...] = ()
         self._character_builder = CharacterBuilder(sprite_keeper)
+        self._entry_points: dict[str, Position] = {}
 
     @property
     def characters(self) -> tuple[Character, ...]:
-        return tuple(self._characters)
+        return self._characters_snapshot
 
     @property
     def character_builder(self) -> CharacterBuilder:
@@ -145,22 +234,30 @@ class AdventureMap:
 
     def add_characters(self, *characters: Character) -> None:
         self._characters.update(characters)
+        self._characters_snapshot = tuple(self._characters)
+
+    def get_entry_point(self, name: str) -> Position:
+        return self._entry_points[name]
 
     def get_layer(self, name: str) -> TiledElement:
-        return self._tmx.get_layer_by_name(name)
+        return self._layers[name]
 
     def get_layer_index(self, name: str) -> int:
-        return next(i for i, layer in enumerate(self.tmx.layers) if layer.name == name)
+        return self._layer_indices[name]
 
     def remove_characters(self, *characters: Character) -> None:
         self._characters.difference_update(characters)
+        self._characters_snapshot = tuple(self._characters)
 
     def set_collision_zones(self, new_zones: ZoneList[Zone]) -> None:
         self._collision_zones = new_zones
 
+    def set_entry_points(self, new_entry_points: dict[str, Position]) -> None:
+        self._entry_points = new_entry_points
+
     def set_trigger_zones(self, new_zones: ZoneList[TriggerZone]) -> None:
         self._trigger_zones = new_zones
 
     def update(self, dt: float) -> None:
-        for character in self.characters:
+        for character in self._characters_snapshot:
             character.update(dt)
@@ -1,3 +1,4 @@
+import sys
 from typing import assert_never
 
 import pygame as pg
@@ -7,15 +8,19 @@ from pygame import Surface
 # from shared import Direction
 # from sprites import Animation, SpriteKeeper
 from src.shared import Direction
-from src.sprites import Animation, SpriteKeeper
+from src.sprites import Animation, SpriteKeeper, SpriteSheet
 
 from .blueprint import EntityBlueprint
 
+# The tiles of a split atlas and the flipped versions of those tiles made so far.
+_Split = tuple[list[Surface], dict[int, Surface]]
+
 
 class AnimationBuilder:
 
     def __init__(self, sprite_keeper: SpriteKeeper):
         self._sprite_keeper = sprite_keeper
+        self._splits: dict[tuple[SpriteSheet, int, int, bool], _Split] = {}
 
     def build(self, entity_def: EntityBlueprint) -> dict[str, Animation]:
         framewidth = entity_def.framewidth
@@ -23,47 +28,66 @@ class AnimationBuilder:
         alpha = entity_def.alpha
         atlas = self._sprite_keeper.sprite(entity_def.source, alpha)
 
-        sprites = atlas.split((framewidth, frameheight),
-                              alpha=alpha)
+        sprites, flipped_sprites = self._split(atlas, framewidth, frameheight, alpha)
         framerate = entity_def.framerate
         face_direction = Direction(entity_def.face_direction)
 
         animations = {}
         for anim, anim_data in entity_def.animations.items():
-            frames = {}
-            for direction, frames_data in anim_data.items():
-                frames[Direction(direction)] = [
-                    sprites[i] for i in frames_data.values()]
+            frame_indices = {Direction(direction): list(frames_data.values())
+                             for direction, frames_data in anim_data.items()}
+            frames = {direction: [sprites[i] for i in indices]
+                      for direction, indices in frame_indices.items()}
 
             if entity_def.flip == "right-left":
-                frames |= _flipped_left(frames)
+                frames |= _flipped_left(frame_indices, sprites, flipped_sprites)
             elif entity_def.flip is None:
                 pass
             else:
                 assert_never(entity_def.flip)
 
-            animations[anim] = Animation(frames=frames,
+            animations[sys.intern(anim)] = Animation(frames=frames,
                                          frame_rate=framerate,
                                          initial_state=face_direction,
                                          )
 
         return animations
 
+    def _split(self, atlas: SpriteSheet, framewidth: int, frameheight: int, alpha: bool) -> _Split:
+        key = (atlas, framewidth, frameheight, alpha)
+        try:
+            return self._splits[key]
+        except KeyError:
+            sprites = atlas.split((framewidth, frameheight), alpha=alpha)
+            return self._splits.setdefault(key, (sprites, {}))
 
-def _flipped_left(source: dict[Direction, list[Surface]]) -> dict[Direction, list[Surface]]:
-    flipped: dict[Direction, list[Surface]] = {}
 
-    supported_directions = {Direction.DOWNRIGHT: Direction.DOWNLEFT,
-                            Direction.RIGHT: Direction.LEFT,
-                            Direction.UPRIGHT: Direction.UPLEFT}
+_FLIPPED_DIRECTIONS = {Direction.DOWNRIGHT: Direction.DOWNLEFT,
+                       Direction.RIGHT: Direction.LEFT,
+                       Direction.UPRIGHT: Direction.UPLEFT}
+
 
-    for direction, frames in source.items():
+def _flipped_left(source: dict[Direction, list[int]],
+                  sprites: list[Surface],
+                  flipped_sprites: dict[int, Surface],
+                  ) -> dict[Direction, list[Surface]]:
+
+    flipped: dict[Direction, list[Surface]] = {}
+
+    for direction, indices in source.items():
         try:
-            flipped_direction = supported_directions[direction]
+            flipped_direction = _FLIPPED_DIRECTIONS[direction]
         except KeyError:
             continue
 
-        flipped[flipped_direction] = [
-            pg.transform.flip(frame, True, False) for frame in frames]
+        frames = []
+        for i in indices:
+            try:
+                frame = flipped_sprites[i]
+            except KeyError:
+                frame = flipped_sprites[i] = pg.transform.flip(sprites[i], True, False)
+            frames.append(frame)
+
+        flipped[flipped_direction] = frames
 
     return flipped
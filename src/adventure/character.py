@@ -5,21 +5,44 @@ from __future__ import annotations
 from src.shared import Controller
 
 from .blueprint import AdventureMapTrigger
-from .character_controller import MovementController
+from .character_controller import AnimationController, MovementController
 from .entity import MovingEntity
 
 
+class _IdleController(Controller):
+
+    __slots__ = ()
+
+    def update(self, dt: float) -> None:
+        pass
+
+
+# Stands in for the animation and the movement controllers until they are added.
+_IDLE_CONTROLLER = _IdleController()
+
+
 class Character:
 
+    __slots__ = ("_name",
+                 "_entity",
+                 "_controllers",
+                 "_trigger",
+                 "_animation_controller",
+                 "_movement_controller",
+                 )
+
     def __init__(self, name: str, entity: MovingEntity, trigger: AdventureMapTrigger | None = None) -> None:
 
         self._name = name
         self._entity = entity
         self._controllers: list[Controller] = []
         self._trigger = trigger
+        self._animation_controller: Controller = _IDLE_CONTROLLER
+        self._movement_controller: Controller = _IDLE_CONTROLLER
 
     @property
     def movement_controller(self) -> MovementController:
+        assert isinstance(self._movement_controller, MovementController), "The character has no movement controller."
         return self._movement_controller
 
     @property
@@ -30,13 +53,18 @@ class Character:
     def trigger(self) -> AdventureMapTrigger | None:
         return self._trigger
 
+    def add_animation_controller(self, controller: AnimationController) -> None:
+        self._animation_controller = controller
+
     def add_controller(self, controller: Controller) -> None:
         self._controllers.append(controller)
 
     def add_movement_controller(self, controller: MovementController) -> None:
         self._movement_controller = controller
-        self._controllers.append(controller)
 
     def update(self, dt: float) -> None:
+        self._animation_controller.update(dt)
+        self._movement_controller.update(dt)
+
         for controller in self._controllers:
             controller.update(dt)
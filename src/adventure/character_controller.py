@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import random
+import sys
 from abc import abstractmethod
 from enum import Enum
 from functools import partial
 from typing import TYPE_CHECKING, Literal, Mapping, Type, TypeAlias
 
-import pygame as pg
-from bidict import bidict
+from pygame import Surface
 from transitions import EventData, Machine, State, core
 from tuple_math import pair
 from typing_extensions import override
@@ -22,47 +22,71 @@ from .entity import MovingEntity
 UnitVector: TypeAlias = Literal[-1, 0, 1]
 Coordinate: TypeAlias = pair[UnitVector]
 
-_COORD_DIR_TRANSLATOR: bidict[Coordinate,
-                              Direction | None] = bidict({(0, 1): Direction.DOWN,
-                                                          (1, 0): Direction.RIGHT,
-                                                          (0, -1): Direction.UP,
-                                                          (-1, 0): Direction.LEFT,
-                                                          (-1, 1): Direction.DOWNLEFT,
-                                                          (1, -1): Direction.UPRIGHT,
-                                                          (1, 1): Direction.DOWNRIGHT,
-                                                          (-1, -1): Direction.UPLEFT,
-                                                          (0, 0): None,
-                                                          })
+_DIRECTION_TO_COORDINATE: dict[Direction, Coordinate] = {Direction.DOWN: (0, 1),
+                                                          Direction.RIGHT: (1, 0),
+                                                          Direction.UP: (0, -1),
+                                                          Direction.LEFT: (-1, 0),
+                                                          Direction.DOWNLEFT: (-1, 1),
+                                                          Direction.UPRIGHT: (1, -1),
+                                                          Direction.DOWNRIGHT: (1, 1),
+                                                          Direction.UPLEFT: (-1, -1),
+                                                          }
+
+
+def _build_direction_index() -> list[Direction | None]:
+    # Indexed by (x + 1) * 3 + (y + 1), so that a lookup doesn't need a coordinate tuple.
+    index: list[Direction | None] = [None] * 9
+    for direction, (x, y) in _DIRECTION_TO_COORDINATE.items():
+        index[(x + 1) * 3 + (y + 1)] = direction
+    return index
+
+
+_DIRECTION_BY_INDEX = _build_direction_index()
+
+_DIRECTION_BITS = {direction: 1 << i for i, direction in enumerate(Direction)}
+# The directions which are left for every possible combination of blocked ones.
+_AVAILABLE_BY_MASK: tuple[tuple[Direction, ...], ...] = tuple(
+    tuple(direction for direction, bit in _DIRECTION_BITS.items() if not mask & bit)
+    for mask in range(1 << len(_DIRECTION_BITS)))
 
 
 def coordinate_to_direction(coordinate: Coordinate) -> Direction | None:
-    return _COORD_DIR_TRANSLATOR.get(coordinate, None)
+    x, y = coordinate
+    return unit_vectors_to_direction(x, y)
 
 
 def direction_to_coordinate(direction: Direction) -> Coordinate:
-    return _COORD_DIR_TRANSLATOR.inv.get(direction)
+    return _DIRECTION_TO_COORDINATE[direction]
+
+
+def unit_vectors_to_direction(x: UnitVector, y: UnitVector) -> Direction | None:
+    return _DIRECTION_BY_INDEX[(x + 1) * 3 + (y + 1)]
 
 
 class AnimationController(Controller):
 
+    __slots__ = ("_entity", "_image", "_animation", "_last_state")
+
     _animation: Animation
     _last_state: str
 
     def __init__(self, entity: MovingEntity) -> None:
         self._entity = entity
+        self._image: Surface | None = None
         state = self._get_state()
         self._load_state(state)
 
     def update(self, dt: float) -> None:
-        state = self._get_state()
-        if state != self._last_state:
+        state = self._entity.state
+        if state is not self._last_state and state != self._last_state:
             self._load_state(state)
-        else:
-            self._animation.update(dt)
+            dt = 0
+
+        image = self._animation.tick(dt, self._entity.face_direction)
 
-        face_direction = self._entity.face_direction
-        self._animation.state = Direction(face_direction)
-        self._entity.image = self._animation.get_image()
+        if image is not self._image:
+            self._entity.image = image
+            self._image = image
 
     def _get_state(self) -> str:
         return self._entity.state
@@ -79,9 +103,11 @@ class MovementController(Machine, Controller):
         @property
         def model(self) -> MovingEntity: ...
         def get_model_state(self, model: object) -> MovementState: ...
+        def get_state(self, state: str | Enum) -> MovementState: ...
         def trigger(self, _: str, **kwargs: object) -> None: ...
 
     transitions: list[list[str | list[str]] | dict[str, str | list[str]]]
+    _current_state: MovementState
 
     def __init__(self,
                  model: MovingEntity,
@@ -138,14 +164,18 @@ class MovementController(Machine, Controller):
                   model: object | None = None,
                   ) -> None:
 
+        state = self.get_state(new_state.name if isinstance(new_state, State) else new_state)
+
         # Ensure the model's state changes on each call.
-        super().set_state(new_state, model)
+        super().set_state(state, model)
         assert model != self.model
-        super().set_state(new_state, self.model)
+        super().set_state(state, self.model)
+
+        self._current_state = state
 
     @override
     def update(self, dt: float) -> None:
-        self.get_model_state(self.model).update(dt)
+        self._current_state.update(dt)
 
     @override
     def _create_state(self,
@@ -156,28 +186,43 @@ class MovementController(Machine, Controller):
                       ) -> MovementState:
 
         cls = _get_state_cls(name, default)
-        return cls(name=name, machine=self, *args, **kwargs)
+        return cls(name=sys.intern(name), machine=self, *args, **kwargs)
 
     def handle_collision(self, dt: float) -> None:
-        self.get_model_state(self.model).handle_collision(dt)
+        self._current_state.handle_collision(dt)
 
     def move_to_last_stable_ground(self, event: EventData) -> None:
         dt: float = event.kwargs["dt"]
         self.model.to_last_stable_ground(dt)
 
     def set_face_direction(self, event: EventData) -> None:
-        x: UnitVector = event.kwargs.get("x", 0)
-        y: UnitVector = event.kwargs.get("y", 0)
+        kwargs = event.kwargs
+        self._set_face_direction(kwargs.get("x", 0), kwargs.get("y", 0))
 
-        if (direction := coordinate_to_direction((x, y))) is not None:
-            self.model.face_direction = direction
+    def set_movement(self, event: EventData) -> None:
+        """Same as set_unit_vectors followed by set_face_direction, with the event read once."""
+
+        kwargs = event.kwargs
+        x: UnitVector = kwargs.get("x", 0)
+        y: UnitVector = kwargs.get("y", 0)
+
+        self._set_unit_vectors(x, y)
+        self._set_face_direction(x, y)
 
     def set_unit_vectors(self, event: EventData) -> None:
-        x: UnitVector = event.kwargs.get("x", 0)
-        y: UnitVector = event.kwargs.get("y", 0)
+        kwargs = event.kwargs
+        self._set_unit_vectors(kwargs.get("x", 0), kwargs.get("y", 0))
+
+    def _set_face_direction(self, x: UnitVector, y: UnitVector) -> None:
+        if (direction := unit_vectors_to_direction(x, y)) is not None:
+            self.model.face_direction = direction
 
-        self.model.velocity[0] = x * self.model.movement_speed
-        self.model.velocity[1] = y * self.model.movement_speed
+    def _set_unit_vectors(self, x: UnitVector, y: UnitVector) -> None:
+        model = self.model
+        speed = model.movement_speed
+        velocity = model.velocity
+        velocity[0] = x * speed
+        velocity[1] = y * speed
 
 
 class HeroMovementController(MovementController):
@@ -186,7 +231,7 @@ class HeroMovementController(MovementController):
         {"trigger": "walk",
          "source": ["idle", "walking",],
          "dest": "walking",
-         "before": ["set_unit_vectors", "set_face_direction",]},
+         "before": ["set_movement",]},
 
         {"trigger": "stop",
          "source": ["idle", "walking",],
@@ -236,6 +281,8 @@ class HeroMovementController(MovementController):
 
 class MovementState(State):
 
+    __slots__ = ("_machine",)
+
     def __init__(self,
                  name: str | Enum,
                  machine: MovementController,
@@ -272,8 +319,6 @@ class IdleState(HeroMovementState):
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
-
         x, y = get_coordinate_from_pressed()
         if x or y:
             self._machine.trigger("walk", x=x, y=y)
@@ -281,6 +326,8 @@ class IdleState(HeroMovementState):
 
 class WalkingState(HeroMovementState):
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self,
                  name: str | Enum,
                  machine: MovementController,
@@ -294,8 +341,6 @@ class WalkingState(HeroMovementState):
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
-
         x, y = get_coordinate_from_pressed()
 
         if not x and not y:
@@ -316,8 +361,6 @@ class ImmobileState(HeroMovementState):
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
-
         x, y = get_coordinate_from_pressed()
         if x or y:
             self._machine.trigger("look", x=x, y=y)
@@ -340,7 +383,7 @@ class NPCMovementController(MovementController):
         {"trigger": "wander",
          "source": ["npc_planning", "npc_idle",],
          "dest": "npc_wandering",
-         "before": ["set_unit_vectors", "set_face_direction",],
+         "before": ["set_movement",],
          "after": ["reset_state",]},
 
         {"trigger": "stop",
@@ -377,10 +420,10 @@ class NPCMovementController(MovementController):
     ]
 
     def reset_state(self, event: EventData) -> None:
-        self.get_model_state(self.model).reset()
+        self._current_state.reset()
 
     def soft_reset_state(self, event: EventData) -> None:
-        state = self.get_model_state(self.model)
+        state = self._current_state
         assert isinstance(state, NPCPlanningState)
         state.soft_reset()
 
@@ -412,6 +455,8 @@ class NPCMovementState(MovementState):
 
 class NPCIdleState(NPCMovementState):
 
+    __slots__ = ("_duration", "_timer")
+
     def __init__(self,
                  name: str | Enum,
                  machine: NPCMovementController,
@@ -425,8 +470,6 @@ class NPCIdleState(NPCMovementState):
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
-
         if self._timer is None:
             return
 
@@ -442,6 +485,8 @@ class NPCIdleState(NPCMovementState):
 
 class NPCPlanningState(NPCMovementState):
 
+    __slots__ = ("_duration", "_duration_after_block", "_timer", "_blocked")
+
     def __init__(self,
                  name: str | Enum,
                  machine: NPCMovementController,
@@ -453,32 +498,31 @@ class NPCPlanningState(NPCMovementState):
         self._duration: float = kwargs["duration"]
         self._duration_after_block: float = kwargs["duration_after_block"]
         self._timer = self._duration
-        self._blocked: set[Direction] = set()
+        # A mask of _DIRECTION_BITS.
+        self._blocked = 0
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
-
         self._timer -= dt
 
         if self._timer > 0:
             return
 
-        available = set(Direction).difference(self._blocked)
+        available = _AVAILABLE_BY_MASK[self._blocked]
 
         if not available:
             self._machine.trigger("find_oneself_stuck")
             return
 
-        direction = random.choice(tuple(available))
-        self._blocked.add(direction)
+        direction = random.choice(available)
+        self._blocked |= _DIRECTION_BITS[direction]
         x, y = direction_to_coordinate(direction)
         self._machine.trigger("wander", x=x, y=y)
 
     @override
     def reset(self) -> None:
         self._timer = self._duration
-        self._blocked.clear()
+        self._blocked = 0
 
     def soft_reset(self) -> None:
         self._timer = self._duration_after_block
@@ -486,6 +530,8 @@ class NPCPlanningState(NPCMovementState):
 
 class NPCWanderingState(NPCMovementState):
 
+    __slots__ = ("_duration", "_timer", "_has_moved")
+
     def __init__(self,
                  name: str | Enum,
                  machine: NPCMovementController,
@@ -509,13 +555,12 @@ class NPCWanderingState(NPCMovementState):
 
     @override
     def update(self, dt: float) -> None:
-        super().update(dt)
+        # A timer which has already been ticked means that the entity has moved on a previous frame.
+        if not self._has_moved and self._timer < self._duration:
+            self._has_moved = True
 
         self._timer -= dt
 
-        if not self._has_moved and self._duration > self._timer + dt:
-            self._has_moved = True
-
         if self._timer <= 0:
             self._machine.trigger("stop")
 
@@ -549,25 +594,16 @@ class CharacterType(Enum):
 
 
 def _get_state_cls(state: str, default: Type[MovementState]) -> Type[MovementState]:
-    try:
-        return MovementStateType[state.upper()].value
-    except KeyError:
-        return default
+    return _STATE_CLASSES.get(state.lower(), default)
+
+
+_STATE_CLASSES = {state_type.name.lower(): state_type.value for state_type in MovementStateType}
 
 
 def get_coordinate_from_pressed() -> Coordinate:
-    pressed = pg.key.get_pressed()
-    x: UnitVector = 0
-    y: UnitVector = 0
-
-    if any(pressed[key] for key in keybind.UP):
-        y -= 1
-    if any(pressed[key] for key in keybind.DOWN):
-        y += 1
-
-    if any(pressed[key] for key in keybind.LEFT):
-        x -= 1
-    if any(pressed[key] for key in keybind.RIGHT):
-        x += 1
+    is_pressed = keybind.get_pressed().__getitem__
+
+    x: UnitVector = any(map(is_pressed, keybind.RIGHT)) - any(map(is_pressed, keybind.LEFT))  # type: ignore[assignment]
+    y: UnitVector = any(map(is_pressed, keybind.DOWN)) - any(map(is_pressed, keybind.UP))  # type: ignore[assignment]
 
     return x, y
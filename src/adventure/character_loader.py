@@ -3,8 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import assert_never
 
-from lupa import LuaRuntime
-
 # TODO:
 # from sprites import SpriteKeeper
 from src.sprites import SpriteKeeper
@@ -14,6 +12,7 @@ from .blueprint import CharacterBlueprint
 from .character import Character
 from .character_controller import AnimationController, CharacterType
 from .entity import MovingEntity
+from .lua_runtime import execute_blueprint
 
 
 class CharacterLoader:
@@ -22,9 +21,7 @@ class CharacterLoader:
         self._builder = CharacterBuilder(sprite_keeper)
 
     def load(self, char_path: Path, char_type: str | CharacterType = CharacterType.NPC) -> Character:
-        lua = LuaRuntime(unpack_returned_tuples=True)
-        with open(char_path, "r") as file:
-            char_def: CharacterBlueprint = lua.execute(file.read())
+        char_def: CharacterBlueprint = execute_blueprint(char_path)
         return self._builder.build(char_def=char_def, char_type=char_type)
 
 
@@ -66,7 +63,7 @@ def _setup_character(character: Character, char_def: CharacterBlueprint, char_ty
         assert_never(char_type)
 
     cls = char_type.value
-    character.add_controller(AnimationController(character.entity))
+    character.add_animation_controller(AnimationController(character.entity))
     character.add_movement_controller(cls(
         character.entity, state_table=char_def.defined_states, initial=char_def.state))
     return character
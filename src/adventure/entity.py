@@ -26,6 +26,8 @@ MOVEMENT_SPEED_CAP = 1500
 
 class Entity(Sprite):
 
+    __slots__ = ("image", "rect", "_position")
+
     _position: list[float]
 
     def __init__(self,
@@ -41,10 +43,20 @@ class Entity(Sprite):
                           position["y"]] if position is not None else [0, 0]
         self._match_position()
 
+    @property
+    def collision_box(self) -> Rect:
+        return self.rect
+
     @property
     def position(self) -> pair[int]:
         return tuple_math.intify(self._position)
 
+    def find_collision(self, zones: Sequence[Rect]) -> int:
+        return self.rect.collidelist(zones)
+
+    def find_all_collisions(self, zones: Sequence[Rect]) -> list[int]:
+        return self.rect.collidelistall(zones)
+
     def set_position(self, x: int, y: int) -> None:
         self._position = [x, y]
         self._match_position()
@@ -58,6 +70,19 @@ class Entity(Sprite):
 
 class MovingEntity(Entity):
 
+    __slots__ = ("state",
+                 "mask",
+                 "_face_direction",
+                 "_default_image",
+                 "_collision_box",
+                 "_last_stable_x",
+                 "_last_stable_y",
+                 "_animations",
+                 "_movement_speed",
+                 "_velocity",
+                 "_active_zones",
+                 )
+
     def __init__(self,
                  *args: object,
                  animations: dict[str, Animation],
@@ -95,7 +120,8 @@ class MovingEntity(Entity):
                          **kwargs,
                          )
 
-        self._last_stable_ground = list(self._position)
+        # The position from before the last move.
+        self._last_stable_x, self._last_stable_y = self._position
 
         self._animations = animations
         self._movement_speed = movement_speed
@@ -113,6 +139,7 @@ class MovingEntity(Entity):
         return self._active_zones
 
     @property
+    @override
     def collision_box(self) -> Rect:
         return self._collision_box
 
@@ -126,7 +153,7 @@ class MovingEntity(Entity):
 
     @face_direction.setter
     def face_direction(self, new: str | Direction) -> None:
-        self._face_direction = Direction(new)
+        self._face_direction = new if type(new) is Direction else Direction(new)
 
     @property
     def movement_speed(self) -> float:
@@ -137,20 +164,25 @@ class MovingEntity(Entity):
         self._movement_speed = new_value
         self._ensure_valid_ms()
 
+    @override
     def find_collision(self, zones: Sequence[Rect]) -> int:
         return self._collision_box.collidelist(zones)
 
+    @override
     def find_all_collisions(self, zones: Sequence[Rect]) -> list[int]:
         return self._collision_box.collidelistall(zones)
 
     def to_last_stable_ground(self, dt: float) -> None:
-        self._position = list(self._last_stable_ground)
+        self._position[0] = self._last_stable_x
+        self._position[1] = self._last_stable_y
         self._match_position()
 
     def update(self, dt: float) -> None:
-        self._last_stable_ground = list(self._position)
-        self._position[0] += self._velocity[0] * dt
-        self._position[1] += self._velocity[1] * dt
+        position = self._position
+        velocity = self._velocity
+        self._last_stable_x, self._last_stable_y = position
+        position[0] += velocity[0] * dt
+        position[1] += velocity[1] * dt
         self._match_position()
 
     def _ensure_valid_ms(self) -> None:
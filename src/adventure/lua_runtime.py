@@ -0,0 +1,145 @@
+import os
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from lupa import LuaRuntime
+
+# Each execution gets a fresh global environment which falls back to the shared globals, along with its own require,
+# so that neither the globals nor the modules loaded by one blueprint leak into the next one.
+# The compiled blueprints are kept as bytecode, so that a file is only parsed again once it has changed.
+_BLUEPRINT_EXECUTOR = """
+function()
+    local compiled = {}
+    -- The standard libraries are shared, everything else is loaded anew for each blueprint.
+    local builtins = {}
+    for name, module in pairs(package.loaded) do
+        builtins[name] = module
+    end
+
+    local function load_chunk(source, name, mode, env)
+        if setfenv then
+            return setfenv(assert(loadstring(source, name)), env)
+        end
+        return assert(load(source, name, mode, env))
+    end
+
+    local function read_file(path)
+        local file = assert(io.open(path, "r"))
+        local source = file:read("*a")
+        file:close()
+        return source
+    end
+
+    local function make_require(env)
+        local loaded = {}
+        return function(modname)
+            local module = loaded[modname] or builtins[modname]
+            if module ~= nil then
+                return module
+            end
+
+            local path = package.searchpath(modname, package.path)
+            if path == nil then
+                -- Let the shared require look for C modules and report the modules which can't be found.
+                return require(modname)
+            end
+
+            module = load_chunk(read_file(path), "@" .. path, "t", env)(modname, path)
+            if module == nil then
+                module = true
+            end
+            loaded[modname] = module
+            return module
+        end
+    end
+
+    local function dedup_package_path()
+        local seen, entries = {}, {}
+        for entry in string.gmatch(package.path, "[^;]+") do
+            if not seen[entry] then
+                seen[entry] = true
+                entries[#entries + 1] = entry
+            end
+        end
+        package.path = table.concat(entries, ";")
+    end
+
+    local executor = {}
+
+    function executor.execute(name, stamp, read_source)
+        local entry = compiled[name]
+        if entry == nil or entry.stamp ~= stamp then
+            local chunk, err = (loadstring or load)(read_source(), name)
+            if not chunk then error(err, 0) end
+            entry = {stamp = stamp, bytecode = string.dump(chunk)}
+            compiled[name] = entry
+        end
+
+        local env = setmetatable({}, {__index = _G})
+        env.require = make_require(env)
+        local result = load_chunk(entry.bytecode, name, "b", env)()
+        -- The blueprints extend the package path on every execution.
+        dedup_package_path()
+        return result, env
+    end
+
+    function executor.execute_in(env, source, name)
+        return load_chunk(source, name, "t", env)()
+    end
+
+    return executor
+end
+"""
+
+
+def create_lua_runtime() -> LuaRuntime:
+    """Create a runtime for executing the blueprints.
+    LuaJIT is opt-in (set WIZ_LUAJIT) since it implements Lua 5.1 while the blueprints are written for lupa's default
+    Lua version; the default runtime is also used whenever lupa comes without LuaJIT."""
+
+    if os.environ.get("WIZ_LUAJIT"):
+        with suppress(ImportError):
+            from lupa.luajit21 import LuaRuntime as LuaJITRuntime
+            return LuaJITRuntime(unpack_returned_tuples=True)
+
+    return LuaRuntime(unpack_returned_tuples=True)
+
+
+def execute_blueprint(path: Path) -> Any:
+    """Execute a blueprint file in the shared runtime and return the result."""
+
+    result, _ = load_blueprint(path)
+    return result
+
+
+def execute_in_blueprint_env(env: Any, source: str, name: str = "=trigger") -> Any:
+    """Execute a snippet of Lua code in the environment of a loaded blueprint and return the result."""
+
+    return _get_blueprint_executor().execute_in(env, source, name)
+
+
+def load_blueprint(path: Path) -> tuple[Any, Any]:
+    """Execute a blueprint file in the shared runtime and return the result along with the environment it ran in."""
+
+    def read_source() -> str:
+        with open(path, "r") as file:
+            return file.read()
+
+    stat = os.stat(path)
+    # The file is only read and parsed again if either of these has changed since the last execution.
+    stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+    return _get_blueprint_executor().execute(f"@{path}", stamp, read_source)
+
+
+@lru_cache(maxsize=None)
+def get_lua_runtime() -> LuaRuntime:
+    """Return the runtime shared by all the loaders, so that it is only set up once."""
+
+    return create_lua_runtime()
+
+
+@lru_cache(maxsize=None)
+def _get_blueprint_executor() -> Any:
+    return get_lua_runtime().eval(_BLUEPRINT_EXECUTOR)()
@@ -1,8 +1,7 @@
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import Any, Callable, Iterable
 
 import pytmx
-from lupa import LuaRuntime
 from pygame import Rect
 
 # TODO:
@@ -16,7 +15,8 @@ from .adventure_map import (
     Zone,
     ZoneList,
 )
-from .blueprint import AdventureMapBlueprint
+from .blueprint import AdventureMapBlueprint, Position
+from .lua_runtime import execute_in_blueprint_env, load_blueprint
 
 COLLISION_LAYER = "collisions"
 TRIGGER_LAYER = "interaction_zones"
@@ -31,19 +31,20 @@ class MapLoader:
         # NOTE: A new sprite keeper is created for each map although it might be better to share one.
 
     def load(self, map_path: Path) -> AdventureMap:
-        lua = LuaRuntime(unpack_returned_tuples=True)
-        with open(map_path, "r") as file:
-            map_def: AdventureMapBlueprint = lua.execute(file.read())
+        map_def: AdventureMapBlueprint
+        map_def, map_env = load_blueprint(map_path)
         tmx = pytmx.load_pygame(self.resource_dir / map_def.tmx)
         sprite_keeper = SpriteKeeper(self.resource_dir)
 
         new_map = AdventureMap(tmx=tmx, sprite_keeper=sprite_keeper)
+        new_map.set_entry_points({name: Position(x=point["x"], y=point["y"])
+                                  for name, point in map_def.entryPoints.items()})
 
-        return self._setup_map(new_map=new_map, lua=lua, on_load=map_def.onLoad.values())
+        return self._setup_map(new_map=new_map, env=map_env, on_load=map_def.onLoad.values())
 
     def _setup_map(self,
                    new_map: AdventureMap,
-                   lua: LuaRuntime,
+                   env: Any,
                    on_load: Iterable[Callable[[AdventureMap], None]],
                    ) -> AdventureMap:
 
@@ -56,24 +57,22 @@ class MapLoader:
         # Set the default layer where the sprites will be loaded.
         new_map.default_layer = new_map.get_layer_index(DEFAULT_LAYER)
 
-        collision_zones: ZoneList[Zone] = ZoneList()
-        for obj in new_map.get_layer(COLLISION_LAYER):
-            rect = Rect(obj.x, obj.y, obj.width, obj.height)
-            collision_zones.append(Zone(rect=rect))
+        collision_zones: ZoneList[Zone] = ZoneList(
+            [Zone(rect=Rect(obj.x, obj.y, obj.width, obj.height))
+             for obj in new_map.get_layer(COLLISION_LAYER)])
         new_map.set_collision_zones(collision_zones)
 
         trigger_zones: ZoneList[TriggerZone] = ZoneList()
         for obj in new_map.get_layer(TRIGGER_LAYER):
             rect = Rect(obj.x, obj.y, obj.width, obj.height)
-            trigger = lua.execute(obj.properties[TRIGGER_PROPERTY])
+            # The triggers run in the environment of the map, so that they can use what the map has defined.
+            trigger = execute_in_blueprint_env(env, obj.properties[TRIGGER_PROPERTY])
             trigger_zones.append(TriggerZone(rect=rect, trigger=trigger))
         # Loaded NPCs are also treated as walking trigger zones.
-        for character in new_map.characters:
-            # NOTE: You can use the entire character rect as a trigger rect instead,
-            # or even create some sort of a trigger rect.
-            rect = character.entity.collision_box
-            trigger = character.trigger
-            trigger_zones.append(CharacterTriggerZone(character=character))
+        # NOTE: You can use the entire character rect as a trigger rect instead,
+        # or even create some sort of a trigger rect.
+        trigger_zones.extend(CharacterTriggerZone(character=character)
+                             for character in new_map.characters)
         new_map.set_trigger_zones(trigger_zones)
 
         return new_map
@@ -5,7 +5,7 @@ from pygame import Rect, Surface
 from pygame.sprite import Sprite
 from pyscroll import BufferedRenderer, PyscrollGroup
 from pyscroll.data import TiledMapData
-from pytmx import TiledElement, TiledObject
+from pytmx import TiledElement, TiledObject, TiledObjectGroup
 from transitions import core
 from tuple_math import pair
 
@@ -124,9 +124,11 @@ class MapViewer:
         return {layer.name: self._load_layer_sprites(layer) for layer in new_map.tmx.layers}
 
     def _load_layer_sprites(self, layer: TiledElement) -> list[Entity]:
+        if not isinstance(layer, TiledObjectGroup):
+            return []
 
         def supports_entity(obj: Any) -> bool:
-            return isinstance(obj, TiledObject) and obj.image is not None
+            return isinstance(obj, TiledObject) and bool(obj.gid)
 
         def to_entity(obj: TiledObject) -> Entity:
             return Entity(image=obj.image,
@@ -6,14 +6,12 @@ from typing import ClassVar, Iterable
 
 import pygame as pg
 import tuple_math
-from lupa import LuaRuntime
 from pygame import Rect, Surface
 from tuple_math import pair
 
 from src import keybind
 from src.adventure import (
     AdventureMap,
-    AdventureMapBlueprint,
     Character,
     CharacterLoader,
     MapLoader,
@@ -90,6 +88,8 @@ class Game:
         return rects
 
     def update(self, dt: float) -> None:
+        keybind.poll_pressed()
+
         self._map_viewer.update_sprites(dt)
         self._collision_controller.update(dt)
         self._map_viewer.update_characters(dt)
@@ -133,11 +133,7 @@ class Game:
             self, "_hero"), "Cannot load a map before loading a hero."
 
         new_map = self._map_loader.load(path)
-        lua = LuaRuntime(unpack_returned_tuples=True)
-        with open(path, "r") as map_file:
-            map_table: AdventureMapBlueprint = lua.execute(map_file.read())
-
-        spawn = map_table.entryPoints[entry_point]
+        spawn = new_map.get_entry_point(entry_point)
         self._hero.entity.set_position(spawn["x"], spawn["y"])
         new_map.add_characters(self._hero)
         self._current_map = new_map
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pygame as pg
 
 # TODO:
@@ -45,14 +47,31 @@ SEND = (pg.K_RETURN,
         )
 
 
+def get_pressed() -> Sequence[bool]:
+    """Return the keyboard state taken by the last poll_pressed call."""
+
+    return _pressed if _pressed is not None else poll_pressed()
+
+
 def key_to_direction(key: int) -> Direction | None:
-    return next((direction for bind, direction in _KEY_TO_DIRECTION.items() if key in bind),
-                None)
+    return _KEY_TO_DIRECTION.get(key, None)
+
+
+def poll_pressed() -> Sequence[bool]:
+    """Take a snapshot of the keyboard state. Meant to be called once per frame."""
+
+    global _pressed
+    _pressed = pg.key.get_pressed()
+    return _pressed
+
+
+_pressed: Sequence[bool] | None = None
 
 
-_KEY_TO_DIRECTION = {
-    UP: Direction.UP,
-    DOWN: Direction.DOWN,
-    LEFT: Direction.LEFT,
-    RIGHT: Direction.RIGHT,
-}
+_KEY_TO_DIRECTION = {key: direction
+                     for bind, direction in ((UP, Direction.UP),
+                                             (DOWN, Direction.DOWN),
+                                             (LEFT, Direction.LEFT),
+                                             (RIGHT, Direction.RIGHT),
+                                             )
+                     for key in bind}
@@ -32,6 +32,8 @@ def calculate_subsurface_size(surface: Surface, padding: tuple[int, int, int, in
 
 class Controller:
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, dt: float) -> None: ...
 
@@ -1,12 +1,25 @@
-from contextlib import suppress
-from typing import TypeVar
+from typing import Generic, TypeVar
 
 from pygame import Surface
 
 T = TypeVar("T", bound=object)
 
 
-class Animation:
+class Animation(Generic[T]):
+
+    __slots__ = ("_frames",
+                 "_frame_rate",
+                 "_current_frame",
+                 "_default_image",
+                 "_default_frames",
+                 "_state",
+                 "_state_frames",
+                 "_state_len",
+                 )
+
+    _state: T
+    _state_frames: list[Surface]
+    _state_len: int
 
     def __init__(self,
                  frames: dict[T, list[Surface]],
@@ -17,9 +30,11 @@ class Animation:
 
         self._frames = frames
         self._frame_rate = frame_rate
-        self.state = initial_state
         self._current_frame: float = initial_frame
-        self._default_image = self.get_image()
+        self._default_image = frames[initial_state][initial_frame]
+        # Used for the states which have no frames of their own.
+        self._default_frames = [self._default_image]
+        self._load_state(initial_state)
 
     @property
     def current_frame(self) -> int:
@@ -29,15 +44,43 @@ class Animation:
     def current_frame(self, new_value: int) -> None:
         self._current_frame = new_value
 
+    @property
+    def state(self) -> T:
+        return self._state
+
+    @state.setter
+    def state(self, new_state: T) -> None:
+        if new_state is not self._state:
+            self._load_state(new_state)
+
     def __getitem__(self, key: T) -> list[Surface]:
         return self._frames[key]
 
     def update(self, dt: float) -> None:
         self._current_frame += self._frame_rate * dt
-        if self._current_frame >= len(self._frames[self.state]):
-            self._current_frame = 0
+        if self._current_frame >= self._state_len:
+            # Keep the overshoot so that the animation speed doesn't depend on the frame rate.
+            self._current_frame %= self._state_len
 
     def get_image(self) -> Surface:
-        with suppress(KeyError):
-            return self._frames[self.state][self.current_frame]
-        return self._default_image
+        return self._state_frames[int(self._current_frame)]
+
+    def tick(self, dt: float, state: T) -> Surface:
+        """Set the state, advance the animation and return the current image."""
+
+        if state is not self._state:
+            self._load_state(state)
+
+        self._current_frame += self._frame_rate * dt
+        if self._current_frame >= self._state_len:
+            self._current_frame %= self._state_len
+
+        return self._state_frames[int(self._current_frame)]
+
+    def _load_state(self, new_state: T) -> None:
+        self._state = new_state
+        self._state_frames = self._frames.get(new_state, self._default_frames)
+        self._state_len = len(self._state_frames)
+
+        if self._current_frame >= self._state_len:
+            self._current_frame %= self._state_len
@@ -0,0 +1,242 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.adventure.lua_runtime import (
+    execute_blueprint,
+    execute_in_blueprint_env,
+    get_lua_runtime,
+    load_blueprint,
+)
+
+# Each lupa runtime module has its own error class, and the runtime may be LuaJIT.
+LuaError = sys.modules[type(get_lua_runtime()).__module__].LuaError
+
+
+def write_blueprint(path: Path, source: str) -> Path:
+    path.write_text(source)
+    return path
+
+
+def extend_package_path(directory: Path) -> str:
+    return f'package.path = package.path .. ";{directory}/?.lua"\n'
+
+
+class TestBlueprintIsolation:
+
+    def test_globals_do_not_leak_between_loads(self, tmp_path: Path) -> None:
+        setter = write_blueprint(tmp_path / "setter.lua", "leaked = 42\nreturn leaked")
+        getter = write_blueprint(tmp_path / "getter.lua", "return leaked")
+
+        assert execute_blueprint(setter) == 42
+        assert execute_blueprint(getter) is None
+        assert get_lua_runtime().globals().leaked is None
+
+    def test_each_load_gets_its_own_env(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "counter.lua", "counter = (counter or 0) + 1\nreturn counter")
+
+        first_result, first_env = load_blueprint(path)
+        second_result, second_env = load_blueprint(path)
+
+        assert first_result == second_result == 1
+        assert first_env is not second_env
+
+    def test_required_module_state_does_not_carry_over(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_counter.lua",
+                        "local count = 0\nreturn function() count = count + 1; return count end")
+        path = write_blueprint(tmp_path / "uses_counter.lua",
+                               extend_package_path(tmp_path) + 'return require("iso_counter")()')
+
+        assert [execute_blueprint(path) for _ in range(3)] == [1, 1, 1]
+
+    def test_required_tables_are_not_shared(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_template.lua", "return {speed = 1}")
+        path = write_blueprint(tmp_path / "uses_template.lua",
+                               extend_package_path(tmp_path) + 'return require("iso_template")')
+
+        first = execute_blueprint(path)
+        first.speed = 2
+
+        assert execute_blueprint(path).speed == 1
+
+    def test_module_is_loaded_once_per_blueprint(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_once.lua", "return {}")
+        path = write_blueprint(tmp_path / "requires_twice.lua",
+                               extend_package_path(tmp_path) + 'return require("iso_once") == require("iso_once")')
+
+        assert execute_blueprint(path) is True
+
+    def test_module_globals_go_into_blueprint_env(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_helper.lua", "function helper() return 'helped' end")
+        path = write_blueprint(tmp_path / "uses_helper.lua",
+                               extend_package_path(tmp_path) + 'require("iso_helper")\nreturn helper()')
+
+        result, env = load_blueprint(path)
+
+        assert result == "helped"
+        assert env.helper is not None
+        assert get_lua_runtime().globals().helper is None
+
+    def test_standard_libraries_are_shared(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "uses_string.lua", 'return require("string") == string')
+        assert execute_blueprint(path) is True
+
+    def test_require_after_load_finds_module(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_late.lua", "return 'late-loaded'")
+        path = write_blueprint(tmp_path / "late_map.lua",
+                               extend_package_path(tmp_path) + 'return function() return require("iso_late") end')
+
+        on_load = execute_blueprint(path)
+        execute_blueprint(write_blueprint(tmp_path / "other.lua", "return 0"))
+
+        assert on_load() == "late-loaded"
+
+    def test_missing_module_raises_lua_error(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "missing.lua", 'return require("iso_does_not_exist")')
+
+        with pytest.raises(LuaError, match="iso_does_not_exist"):
+            execute_blueprint(path)
+
+
+def rewrite_keeping_mtime(path: Path, source: str) -> None:
+    mtime_ns = os.stat(path).st_mtime_ns
+    path.write_text(source)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestBytecodeCache:
+
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "cached.lua", "return 'first'")
+        assert execute_blueprint(path) == "first"
+
+        # Same size and mtime, so only the cached bytecode can produce the old result.
+        rewrite_keeping_mtime(path, "return 'other'")
+
+        assert execute_blueprint(path) == "first"
+
+    def test_cached_blueprint_gets_fresh_env(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "cached.lua", "counter = (counter or 0) + 1\nreturn counter")
+
+        _, first_env = load_blueprint(path)
+        result, second_env = load_blueprint(path)
+
+        assert result == 1
+        assert first_env is not second_env
+
+    def test_new_mtime_forces_parse(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "cached.lua", "return 'first'")
+        execute_blueprint(path)
+
+        rewrite_keeping_mtime(path, "return 'other'")
+        mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        assert execute_blueprint(path) == "other"
+
+    def test_new_size_forces_parse(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "cached.lua", "return 'first'")
+        execute_blueprint(path)
+
+        rewrite_keeping_mtime(path, "return 'second'")
+
+        assert execute_blueprint(path) == "second"
+
+    def test_cached_chunk_resolves_globals_against_new_env(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "closures.lua", (
+            "value = (value or 0) + 1\n"
+            "local function get() return value end\n"
+            "return {value = value, get = get}"
+        ))
+
+        first, first_env = load_blueprint(path)
+        second, second_env = load_blueprint(path)
+        first_env.value = 10
+
+        assert second.value == 1
+        assert second.get() == 1
+        assert first.get() == 10
+
+    def test_cached_chunk_closures_get_fresh_upvalues(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "upvalues.lua", (
+            "local count = 0\n"
+            "return function() count = count + 1; return count end"
+        ))
+
+        first = execute_blueprint(path)
+        first()
+        first()
+
+        assert execute_blueprint(path)() == 1
+
+
+class TestPackagePath:
+
+    def test_package_path_is_kept_after_load(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "extends_path.lua", extend_package_path(tmp_path) + "return 0")
+
+        execute_blueprint(path)
+
+        assert f"{tmp_path}/?.lua" in get_lua_runtime().eval("package.path").split(";")
+
+    def test_repeated_loads_do_not_grow_package_path(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "extends_path.lua", extend_package_path(tmp_path) + "return 0")
+
+        execute_blueprint(path)
+        package_path = get_lua_runtime().eval("package.path")
+        for _ in range(3):
+            execute_blueprint(path)
+
+        assert get_lua_runtime().eval("package.path") == package_path
+        assert package_path.split(";").count(f"{tmp_path}/?.lua") == 1
+
+
+class TestBlueprintEnvSnippets:
+
+    def test_snippet_sees_blueprint_globals(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "map.lua", "function greet() return 'hello' end\nreturn {}")
+        _, env = load_blueprint(path)
+
+        greet = execute_in_blueprint_env(env, "return greet")
+
+        assert greet() == "hello"
+
+    def test_snippet_globals_stay_in_blueprint_env(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "map.lua", "return {}")
+        _, env = load_blueprint(path)
+
+        execute_in_blueprint_env(env, "snippet_global = 42")
+
+        assert env.snippet_global == 42
+        assert get_lua_runtime().globals().snippet_global is None
+
+
+class TestChunkNames:
+
+    def test_runtime_error_names_blueprint_file(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "broken.lua", "error('boom')")
+
+        with pytest.raises(LuaError, match="broken.lua"):
+            execute_blueprint(path)
+
+    def test_syntax_error_names_blueprint_file(self, tmp_path: Path) -> None:
+        path = write_blueprint(tmp_path / "malformed.lua", "return {")
+
+        with pytest.raises(LuaError, match="malformed.lua"):
+            execute_blueprint(path)
+
+    def test_error_in_required_module_names_module_file(self, tmp_path: Path) -> None:
+        write_blueprint(tmp_path / "iso_broken.lua", "error('boom')")
+        path = write_blueprint(tmp_path / "uses_broken.lua",
+                               extend_package_path(tmp_path) + 'return require("iso_broken")')
+
+        with pytest.raises(LuaError, match="iso_broken.lua"):
+            execute_blueprint(path)
+
+    def test_snippet_error_names_trigger(self, tmp_path: Path) -> None:
+        _, env = load_blueprint(write_blueprint(tmp_path / "map.lua", "return {}"))
+
+        with pytest.raises(LuaError, match="trigger"):
+            execute_in_blueprint_env(env, "error('boom')")
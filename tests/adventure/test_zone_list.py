@@ -0,0 +1,194 @@
+import random
+
+import pytest
+from pygame import Rect, Surface
+
+from src.adventure.adventure_map import GRID_CELL_SIZE, GRID_THRESHOLD, Zone, ZoneList
+from src.adventure.entity import Entity
+
+
+class MovableZone(Zone):
+
+    movable = True
+
+    __slots__ = ()
+
+
+def make_entity(rect: Rect) -> Entity:
+    entity = Entity(image=Surface(rect.size))
+    entity.rect = Rect(rect)
+    return entity
+
+
+def make_zones(count: int, seed: int = 0) -> list[Zone]:
+    rng = random.Random(seed)
+    return [Zone(Rect(rng.randrange(0, 20 * GRID_CELL_SIZE),
+                      rng.randrange(0, 20 * GRID_CELL_SIZE),
+                      rng.randrange(1, 3 * GRID_CELL_SIZE),
+                      rng.randrange(1, 3 * GRID_CELL_SIZE)))
+            for _ in range(count)]
+
+
+def scan(zones: ZoneList[Zone], entity: Entity) -> list[Zone]:
+    # The linear scan used for short lists, which the grid lookup has to agree with.
+    return [zones[i] for i in entity.find_all_collisions(zones.rects)]
+
+
+def assert_matches_scan(zones: ZoneList[Zone], entity: Entity) -> None:
+    expected = scan(zones, entity)
+    assert list(zones.get_colliding_zones(entity)) == expected
+    assert zones.collides(entity) == bool(expected)
+
+
+class TestZoneList:
+
+    @pytest.fixture
+    def zones(self) -> ZoneList[Zone]:
+        return ZoneList(make_zones(4 * GRID_THRESHOLD))
+
+    @pytest.mark.parametrize("count", (GRID_THRESHOLD - 1, GRID_THRESHOLD, 4 * GRID_THRESHOLD))
+    def test_colliding_zones_match_linear_scan(self, count: int) -> None:
+        zones = ZoneList(make_zones(count))
+        rng = random.Random(count)
+
+        for _ in range(100):
+            rect = Rect(rng.randrange(-GRID_CELL_SIZE, 20 * GRID_CELL_SIZE),
+                        rng.randrange(-GRID_CELL_SIZE, 20 * GRID_CELL_SIZE),
+                        rng.randrange(1, GRID_CELL_SIZE // 2),
+                        rng.randrange(1, GRID_CELL_SIZE // 2))
+            assert_matches_scan(zones, make_entity(rect))
+
+    def test_colliding_zones_keep_stored_order(self) -> None:
+        # Every zone overlaps the same spot but they are spread over different cells.
+        zones = ZoneList([Zone(Rect(GRID_CELL_SIZE - i, GRID_CELL_SIZE - i, 2 * i + 1, 2 * i + 1))
+                          for i in reversed(range(GRID_THRESHOLD))])
+        entity = make_entity(Rect(GRID_CELL_SIZE, GRID_CELL_SIZE, 1, 1))
+
+        assert list(zones.get_colliding_zones(entity)) == list(zones)
+
+    @pytest.mark.parametrize("rect", (
+        Rect(GRID_CELL_SIZE - 8, GRID_CELL_SIZE - 8, 16, 16),
+        Rect(0, 0, 5 * GRID_CELL_SIZE, 3 * GRID_CELL_SIZE),
+        Rect(2 * GRID_CELL_SIZE + 1, 0, 1, 10 * GRID_CELL_SIZE),
+    ))
+    def test_rect_spanning_several_cells_matches_linear_scan(self, zones: ZoneList[Zone], rect: Rect) -> None:
+        assert_matches_scan(zones, make_entity(rect))
+
+    @pytest.mark.parametrize("rect", (
+        Rect(GRID_CELL_SIZE, GRID_CELL_SIZE, 0, 0),
+        Rect(GRID_CELL_SIZE + 10, GRID_CELL_SIZE + 10, 0, 0),
+        Rect(GRID_CELL_SIZE, GRID_CELL_SIZE, 0, 3 * GRID_CELL_SIZE),
+    ))
+    def test_zero_size_rect_matches_linear_scan(self, zones: ZoneList[Zone], rect: Rect) -> None:
+        assert_matches_scan(zones, make_entity(rect))
+
+    def test_zero_size_zone_is_never_collided_with(self) -> None:
+        empty = Zone(Rect(GRID_CELL_SIZE + 10, GRID_CELL_SIZE + 10, 0, 0))
+        zones = ZoneList(make_zones(GRID_THRESHOLD) + [empty])
+        entity = make_entity(Rect(GRID_CELL_SIZE, GRID_CELL_SIZE, 32, 32))
+
+        assert empty not in zones.get_colliding_zones(entity)
+        assert_matches_scan(zones, entity)
+
+    def test_movable_zone_is_found_after_moving(self, zones: ZoneList[Zone]) -> None:
+        movable = MovableZone(Rect(0, 0, 16, 16))
+        zones.append(movable)
+        entity = make_entity(Rect(10 * GRID_CELL_SIZE, 10 * GRID_CELL_SIZE, 16, 16))
+        # Build the grid while the zone is still far away.
+        assert movable not in zones.get_colliding_zones(entity)
+
+        movable.rect.topleft = entity.rect.topleft
+
+        assert movable in zones.get_colliding_zones(entity)
+        assert zones.collides(entity)
+        assert_matches_scan(zones, entity)
+
+    def test_movable_zone_is_not_found_after_moving_away(self, zones: ZoneList[Zone]) -> None:
+        entity = make_entity(Rect(10 * GRID_CELL_SIZE, 10 * GRID_CELL_SIZE, 16, 16))
+        movable = MovableZone(Rect(entity.rect))
+        zones.insert(0, movable)
+        assert movable in zones.get_colliding_zones(entity)
+
+        movable.rect.topleft = (0, 0)
+
+        assert movable not in zones.get_colliding_zones(entity)
+        assert_matches_scan(zones, entity)
+
+    def test_grid_is_rebuilt_after_insert(self, zones: ZoneList[Zone]) -> None:
+        entity = make_entity(Rect(30 * GRID_CELL_SIZE, 30 * GRID_CELL_SIZE, 16, 16))
+        assert not zones.collides(entity)
+        new_zone = Zone(Rect(entity.rect))
+
+        zones.insert(3, new_zone)
+
+        assert list(zones.get_colliding_zones(entity)) == [new_zone]
+        assert zones.collides(entity)
+
+    def test_grid_is_rebuilt_after_setting_item(self, zones: ZoneList[Zone]) -> None:
+        entity = make_entity(Rect(30 * GRID_CELL_SIZE, 30 * GRID_CELL_SIZE, 16, 16))
+        old_zone = zones[5]
+        assert not zones.collides(entity)
+        new_zone = Zone(Rect(entity.rect))
+
+        zones[5] = new_zone
+
+        assert list(zones.get_colliding_zones(entity)) == [new_zone]
+        assert_matches_scan(zones, make_entity(old_zone.rect))
+
+    def test_grid_is_rebuilt_after_setting_slice(self, zones: ZoneList[Zone]) -> None:
+        entity = make_entity(Rect(30 * GRID_CELL_SIZE, 30 * GRID_CELL_SIZE, 16, 16))
+        old_zones = list(zones[:4])
+        assert not zones.collides(entity)
+        new_zones = [Zone(Rect(entity.rect)) for _ in range(2)]
+
+        zones[:4] = new_zones
+
+        assert list(zones.get_colliding_zones(entity)) == new_zones
+        assert zones.rects[:2] == [zone.rect for zone in new_zones]
+        for zone in old_zones:
+            assert_matches_scan(zones, make_entity(zone.rect))
+
+    @pytest.mark.parametrize("index", (0, slice(0, 10), slice(None, None, 3)))
+    def test_grid_is_rebuilt_after_deleting(self, zones: ZoneList[Zone], index: int | slice) -> None:
+        deleted = zones[index]
+        deleted = list(deleted) if isinstance(index, slice) else [deleted]
+        for zone in deleted:
+            assert zones.collides(make_entity(zone.rect))
+
+        del zones[index]
+
+        for zone in deleted:
+            entity = make_entity(zone.rect)
+            assert zone not in zones.get_colliding_zones(entity)
+            assert_matches_scan(zones, entity)
+
+    def test_grid_is_rebuilt_after_extending(self) -> None:
+        zones = ZoneList(make_zones(GRID_THRESHOLD))
+        entity = make_entity(Rect(30 * GRID_CELL_SIZE, 30 * GRID_CELL_SIZE, 16, 16))
+        assert not zones.collides(entity)
+        new_zones = [Zone(Rect(entity.rect)) for _ in range(3)]
+
+        zones.extend(new_zones)
+
+        assert list(zones.get_colliding_zones(entity)) == new_zones
+        assert len(zones.rects) == len(zones)
+
+    def test_extending_with_itself_doubles_the_zones(self) -> None:
+        zones = ZoneList(make_zones(GRID_THRESHOLD))
+        original = list(zones)
+
+        zones.extend(zones)
+
+        assert list(zones) == original + original
+        assert zones.rects == [zone.rect for zone in zones]
+        assert_matches_scan(zones, make_entity(original[0].rect))
+
+    def test_changing_the_given_list_does_not_affect_zone_list(self) -> None:
+        given = make_zones(GRID_THRESHOLD)
+        zones = ZoneList(given)
+        entity = make_entity(Rect(30 * GRID_CELL_SIZE, 30 * GRID_CELL_SIZE, 16, 16))
+
+        given.append(Zone(Rect(entity.rect)))
+
+        assert len(zones) == GRID_THRESHOLD
+        assert not zones.collides(entity)
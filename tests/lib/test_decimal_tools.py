@@ -0,0 +1,103 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from lib.decimal_tools import (
+    DecimalRange,
+    SupportsDecimal,
+    roll_decimal,
+    roll_decimal_batch,
+)
+
+
+class TestRollDecimal:
+
+    @pytest.mark.parametrize("digits", (0, 1, 2, 3))
+    def test_rolled_value_is_within_bounds(self, digits: int) -> None:
+        minimum, maximum = Decimal(1), Decimal("2.5")
+
+        for _ in range(100):
+            assert minimum <= roll_decimal(minimum, maximum, digits) <= maximum
+
+    @pytest.mark.parametrize("digits", (0, 1, 2, 3))
+    def test_rolled_value_has_no_more_than_given_digits(self, digits: int) -> None:
+        value = roll_decimal(Decimal(0), Decimal(1), digits)
+        assert value == round(value, digits)
+
+    def test_float_bounds_are_accepted(self) -> None:
+        assert Decimal("0.5") <= roll_decimal(0.5, 1.5) <= Decimal("1.5")
+
+    def test_rolling_reversed_bounds_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            _ = roll_decimal(Decimal(2), Decimal(1))
+
+    def test_rolling_equal_bounds_returns_bound(self) -> None:
+        assert roll_decimal(Decimal("3.25"), Decimal("3.25")) == Decimal("3.25")
+
+
+class TestRollDecimalBatch:
+
+    @pytest.mark.parametrize("count", (0, 1, 50))
+    def test_batch_has_requested_length(self, count: int) -> None:
+        assert len(roll_decimal_batch(Decimal(0), Decimal(1), count)) == count
+
+    def test_batched_values_are_within_bounds(self) -> None:
+        minimum, maximum = Decimal("0.5"), Decimal("0.75")
+        assert all(minimum <= value <= maximum
+                   for value in roll_decimal_batch(minimum, maximum, 100))
+
+
+class TestDecimalRange:
+
+    def test_bounds_are_ordered_on_construction(self) -> None:
+        decimal_range = DecimalRange(5, 1)
+        assert (decimal_range.lower, decimal_range.upper) == (1, 5)
+
+    def test_bounds_are_ordered_on_assignment(self) -> None:
+        decimal_range = DecimalRange(1, 5)
+        decimal_range.lower = 10
+        assert (decimal_range.lower, decimal_range.upper) == (5, 10)
+
+    def test_random_value_is_within_bounds(self) -> None:
+        decimal_range = DecimalRange("0.25", "0.75")
+
+        for _ in range(100):
+            value = decimal_range.get_random_value()
+            assert isinstance(value, Decimal)
+            assert decimal_range.lower <= value <= decimal_range.upper
+
+    def test_random_values_are_within_bounds(self) -> None:
+        decimal_range = DecimalRange(1, 2)
+        values = decimal_range.get_random_values(100)
+
+        assert len(values) == 100
+        assert all(1 <= value <= 2 for value in values)
+
+    @pytest.mark.parametrize("bound", (0, "1.25", 3))
+    def test_range_with_equal_bounds_always_returns_bound(self, bound: SupportsDecimal) -> None:
+        decimal_range = DecimalRange(bound, bound)
+
+        assert decimal_range.get_random_value() == Decimal(bound)
+        assert decimal_range.get_random_values(3) == [Decimal(bound)] * 3
+
+    def test_range_with_equal_bounds_draws_from_generator(self) -> None:
+        decimal_range = DecimalRange(1, 1)
+
+        random.seed(0)
+        decimal_range.get_random_value()
+        decimal_range.get_random_values(3)
+        after_rolls = random.random()
+
+        random.seed(0)
+        for _ in range(4):
+            random.randint(100, 100)
+        assert random.random() == after_rolls
+
+    def test_range_stops_being_constant_after_assignment(self) -> None:
+        decimal_range = DecimalRange(1, 1)
+        decimal_range.upper = 2
+
+        values = decimal_range.get_random_values(200)
+        assert all(1 <= value <= 2 for value in values)
+        assert len(set(values)) > 1
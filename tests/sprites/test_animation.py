@@ -0,0 +1,86 @@
+import pytest
+from pygame import Surface
+
+from src.sprites import Animation
+
+FRAME_RATE = 10
+
+
+@pytest.fixture
+def walking() -> list[Surface]:
+    return [Surface((1, 1)) for _ in range(4)]
+
+
+@pytest.fixture
+def idle() -> list[Surface]:
+    return [Surface((1, 1)) for _ in range(2)]
+
+
+@pytest.fixture
+def animation(walking: list[Surface], idle: list[Surface]) -> Animation[str]:
+    return Animation({"walking": walking, "idle": idle}, frame_rate=FRAME_RATE, initial_state="walking")
+
+
+class TestAnimation:
+
+    def test_update_advances_frame_by_frame_rate(self, animation: Animation[str]) -> None:
+        animation.update(2.5 / FRAME_RATE)
+        assert animation.current_frame == 2
+
+    def test_update_keeps_overshoot_when_wrapping(self, animation: Animation[str], walking: list[Surface]) -> None:
+        animation.update(5.5 / FRAME_RATE)
+
+        assert animation.current_frame == 1
+        assert animation.get_image() is walking[1]
+
+    def test_update_wraps_more_than_once_in_a_long_step(self, animation: Animation[str]) -> None:
+        animation.update(9.5 / FRAME_RATE)
+        assert animation.current_frame == 1
+
+    def test_tick_keeps_overshoot_when_wrapping(self, animation: Animation[str], walking: list[Surface]) -> None:
+        assert animation.tick(6.5 / FRAME_RATE, "walking") is walking[2]
+        assert animation.current_frame == 2
+
+    def test_state_without_frames_falls_back_to_default_image(self,
+                                                              animation: Animation[str],
+                                                              walking: list[Surface],
+                                                              ) -> None:
+        animation.current_frame = 3
+        animation.state = "dancing"
+
+        assert animation.current_frame == 0
+        assert animation.get_image() is walking[0]
+
+    def test_tick_on_state_without_frames_returns_default_image(self,
+                                                                animation: Animation[str],
+                                                                walking: list[Surface],
+                                                                ) -> None:
+        for _ in range(5):
+            assert animation.tick(1.5 / FRAME_RATE, "dancing") is walking[0]
+
+    def test_switching_to_state_with_fewer_frames_wraps_frame(self,
+                                                              animation: Animation[str],
+                                                              idle: list[Surface],
+                                                              ) -> None:
+        animation.current_frame = 3
+        animation.state = "idle"
+
+        assert animation.current_frame == 1
+        assert animation.get_image() is idle[1]
+
+    def test_tick_into_state_with_fewer_frames_wraps_frame(self,
+                                                           animation: Animation[str],
+                                                           idle: list[Surface],
+                                                           ) -> None:
+        animation.current_frame = 3
+        assert animation.tick(0, "idle") is idle[1]
+
+    def test_switching_to_state_with_more_frames_keeps_frame(self,
+                                                             animation: Animation[str],
+                                                             walking: list[Surface],
+                                                             ) -> None:
+        animation.state = "idle"
+        animation.current_frame = 1
+        animation.state = "walking"
+
+        assert animation.get_image() is walking[1]